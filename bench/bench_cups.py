@@ -0,0 +1,68 @@
+"""Micro-benchmark del validador de CUPS.
+
+    python -m bench.bench_cups [iteraciones]
+
+Compara la regla anterior (import re + re.match con el patrón como cadena en
+cada llamada, solo forma) con las reglas de CUPS del motor (longitud, patrón
+precompilado, letras de control módulo 529 y, si CUPS_DISTRIBUTORS_PATH está
+configurada, tabla de distribuidoras), y mide comprobar_reglas_negocio (plan
+completo de C1, como en la validación) con un contexto de validación ya creado
+(como en una petición o un lote).
+"""
+import sys
+import timeit
+from app.main import (
+    PlanReglas,
+    ViolacionesNegocio,
+    comprobar_reglas_negocio,
+    crear_contexto_validacion,
+    letras_control_cups,
+    plan_reglas,
+)
+
+CUPS = {
+    "válido": "ES0022000005180955GP",
+    "control mal": "ES0022000005180955CP",
+    "formato mal": "ES00INVALIDO00000000",
+}
+
+CONTEXTO = crear_contexto_validacion()
+PLAN_CUPS = PlanReglas([regla for regla in plan_reglas("C1").reglas if regla.campos == ("cups",)])
+
+
+def regla_anterior(valor: str) -> bool:
+    import re
+
+    patron = r"^ES[A-Z0-9]{18}$"
+    return re.match(patron, valor) is not None
+
+
+def reglas_cups(valor: str) -> list:
+    return PLAN_CUPS.evaluar({"cups": valor}, CONTEXTO)
+
+
+def comprobar_reglas(valor: str) -> None:
+    try:
+        comprobar_reglas_negocio({"cups": valor, "fecha_solicitud": "2100-01-01"}, "C1", CONTEXTO)
+    except ViolacionesNegocio:
+        pass
+
+
+def medir(nombre: str, funcion, valor: str, iteraciones: int) -> None:
+    segundos = timeit.timeit(lambda: funcion(valor), number=iteraciones)
+    print(f"{nombre:<26} {segundos / iteraciones * 1e9:10.0f} ns/llamada")
+
+
+def main_bench() -> None:
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for caso, valor in CUPS.items():
+        print(f"\n{caso}: {valor}")
+        medir("regla anterior", regla_anterior, valor, iteraciones)
+        medir("reglas de CUPS", reglas_cups, valor, iteraciones)
+        medir("comprobar_reglas_negocio", comprobar_reglas, valor, iteraciones // 10)
+    print()
+    medir("letras_control_cups", letras_control_cups, "0022000005180955", iteraciones)
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,82 @@
+"""Benchmark de los modos de VALIDATION_EXECUTOR.
+
+Lanza muchas validaciones concurrentes (parseo + XSD + reglas) y mide, para
+cada modo, el throughput y el bloqueo máximo del event loop (lo que tarda en
+responder una tarea "latido" que debería despertar cada 1 ms). No usa BD ni IA.
+
+Uso (desde la raíz del repo):
+    python -m bench.bench_ejecutor [documentos] [workers]
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+from app.main import DocumentoXML, EjecutorValidacion, registro_esquemas
+
+XML_VALIDO = Path("datos/c1_correcto.xml").read_bytes()
+XML_INVALIDO = Path("datos/c1_xsd_invalido.xml").read_bytes()
+# Documento grande (~4 MB) para simular cargas patológicas
+XML_GRANDE = XML_VALIDO.replace(
+    b"</CambioComercializador>",
+    b"<!--" + b"x" * 4_000_000 + b"-->\n</CambioComercializador>",
+)
+
+
+async def latido(parar: asyncio.Event, retrasos: list) -> None:
+    # Mide cuánto se retrasa el event loop respecto a lo esperado
+    while not parar.is_set():
+        inicio = time.perf_counter()
+        await asyncio.sleep(0.001)
+        retrasos.append(time.perf_counter() - inicio - 0.001)
+
+
+async def medir(modo: str, documentos: int, workers: int) -> None:
+    ejecutor = EjecutorValidacion(modo, workers)
+    ejecutor.iniciar()
+    try:
+        # Calentamiento: arranca hilos/procesos y compila el XSD en cada uno
+        await asyncio.gather(
+            *(ejecutor.ejecutar(DocumentoXML(XML_VALIDO)) for _ in range(workers * 2))
+        )
+
+        cargas = [XML_VALIDO, XML_INVALIDO] * 10 + [XML_GRANDE]
+        lote = [DocumentoXML(cargas[i % len(cargas)]) for i in range(documentos)]
+
+        parar = asyncio.Event()
+        retrasos = []
+        tarea_latido = asyncio.create_task(latido(parar, retrasos))
+        cola_maxima = 0
+
+        async def validar(documento: DocumentoXML) -> None:
+            nonlocal cola_maxima
+            await ejecutor.ejecutar(documento)
+            cola_maxima = max(cola_maxima, ejecutor.profundidad_cola())
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(validar(documento) for documento in lote))
+        duracion = time.perf_counter() - inicio
+        parar.set()
+        await tarea_latido
+
+        print(
+            f"{modo:<10} {documentos / duracion:9.0f} docs/s  "
+            f"bloqueo máx. del loop {max(retrasos, default=0) * 1000:8.1f} ms  "
+            f"cola máx. {cola_maxima}"
+        )
+    finally:
+        ejecutor.cerrar()
+
+
+def main() -> None:
+    documentos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    registro_esquemas.cargar()
+    print(f"{documentos} documentos, {workers} workers")
+    for modo in ("inline", "threads", "processes"):
+        asyncio.run(medir(modo, documentos, workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark del cliente Groq: cliente nuevo por llamada vs. cliente compartido.
+
+Necesita el servidor simulado de bench/stub_llm.py (o un endpoint real):
+    uvicorn bench.stub_llm:app --port 9000
+    GROQ_API_KEY=stub GROQ_BASE_URL=http://127.0.0.1:9000 python -m bench.bench_groq [llamadas] [concurrencia]
+
+El modo "nuevo" reproduce el comportamiento anterior (Groq(...) en cada
+análisis: sin keep-alive, un handshake TCP/TLS por llamada).
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from app import main
+from app.main import DocumentoXML, analizar_error_groq, cerrar_cliente_groq, crear_cliente_groq
+
+DOCUMENTO = DocumentoXML(Path("datos/c1_xsd_invalido.xml").read_bytes())
+ERROR = "Error XSD: Element 'CambioComercializador': Missing child element(s). Expected is ( Agentes )."
+
+
+async def medir(nombre: str, llamadas: int, concurrencia: int, cliente_nuevo: bool) -> None:
+    semaforo = asyncio.Semaphore(concurrencia)
+    latencias = []
+    clientes = []
+    reintentos_previos = main.metricas.valor("groq_reintentos_total")
+
+    def cliente_por_llamada():
+        clientes.append(crear_cliente_groq())
+        return clientes[-1]
+
+    obtener_original = main.obtener_cliente_groq
+    if cliente_nuevo:
+        main.obtener_cliente_groq = cliente_por_llamada
+
+    async def llamar() -> None:
+        async with semaforo:
+            inicio = time.perf_counter()
+            await analizar_error_groq(DOCUMENTO, ERROR)
+            latencias.append(time.perf_counter() - inicio)
+
+    try:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(llamar() for _ in range(llamadas)))
+        duracion = time.perf_counter() - inicio
+    finally:
+        main.obtener_cliente_groq = obtener_original
+        for cliente in clientes:
+            await cliente.close()
+        await cerrar_cliente_groq()
+
+    latencias.sort()
+    p50 = latencias[len(latencias) // 2] * 1000
+    p99 = latencias[int(len(latencias) * 0.99) - 1] * 1000
+    print(
+        f"{nombre:<11} {llamadas / duracion:8.1f} llamadas/s  "
+        f"p50 {p50:7.1f} ms  p99 {p99:7.1f} ms  "
+        f"reintentos {main.metricas.valor('groq_reintentos_total') - reintentos_previos:.0f}"
+    )
+
+
+def main_bench() -> None:
+    llamadas = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrencia = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    print(f"{llamadas} llamadas, concurrencia {concurrencia}, base_url {main.GROQ_BASE_URL}")
+    asyncio.run(medir("nuevo", llamadas, concurrencia, cliente_nuevo=True))
+    asyncio.run(medir("compartido", llamadas, concurrencia, cliente_nuevo=False))
+
+
+if __name__ == "__main__":
+    main_bench()
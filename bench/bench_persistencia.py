@@ -0,0 +1,138 @@
+"""Benchmark de los modos de persistencia de solicitudes_c1.
+
+Compara, para una solicitud válida, el coste en BD de cada modo de
+DB_PERSISTENCE_MODE: número de sentencias, latencia y bytes de WAL generados.
+Requiere una BD accesible en DB_DSN.
+
+Usa versiones síncronas de las escrituras de la API (mismas sentencias SQL),
+con un pool propio: la API solo tiene el pool asíncrono.
+
+Uso (desde la raíz del repo):
+    python -m bench.bench_persistencia [iteraciones]
+"""
+import sys
+import time
+from pathlib import Path
+
+from typing import Optional
+
+from psycopg_pool import ConnectionPool
+
+from app.main import (
+    DSN_BD,
+    SQL_INSERTAR_SOLICITUD,
+    SQL_INSERTAR_SOLICITUD_COMPLETA,
+    aplicar_migraciones,
+    sql_actualizar_solicitud,
+)
+
+XML_TEXTO = Path("datos/c1_correcto.xml").read_text(encoding="utf-8-sig")
+RESULTADO_OK = {
+    "xsd_valido": True,
+    "contenido_valido": True,
+    "analisis_ia": None,
+    "estado_respuesta": 200,
+}
+
+# Se crea cerrado; main() lo abre y lo cierra
+pool_bd = ConnectionPool(DSN_BD, min_size=1, max_size=1, name="bench_persistencia", open=False)
+
+
+def obtener_conexion_bd():
+    # Al salir del "with" se hace commit, como en la API
+    return pool_bd.connection()
+
+
+def insertar_solicitud(xml_recibido: str) -> int:
+    with obtener_conexion_bd() as conn:
+        return conn.execute(SQL_INSERTAR_SOLICITUD, (xml_recibido, None)).fetchone()[0]
+
+
+def insertar_solicitud_completa(
+    xml_recibido: str,
+    *,
+    xsd_valido: Optional[bool],
+    contenido_valido: Optional[bool],
+    analisis_ia: Optional[str],
+    estado_respuesta: Optional[int],
+) -> int:
+    with obtener_conexion_bd() as conn:
+        return conn.execute(
+            SQL_INSERTAR_SOLICITUD_COMPLETA,
+            (xml_recibido, None, xsd_valido, contenido_valido, analisis_ia, estado_respuesta),
+        ).fetchone()[0]
+
+
+def actualizar_solicitud(solicitud_id: int, **campos) -> None:
+    sentencia = sql_actualizar_solicitud(solicitud_id, **campos)
+    if sentencia is not None:
+        with obtener_conexion_bd() as conn:
+            conn.execute(*sentencia)
+
+
+def persistir_pasos() -> int:
+    # Comportamiento original: INSERT + un UPDATE por paso
+    solicitud_id = insertar_solicitud(XML_TEXTO)
+    actualizar_solicitud(solicitud_id, xsd_valido=True)
+    actualizar_solicitud(solicitud_id, contenido_valido=True)
+    actualizar_solicitud(solicitud_id, estado_respuesta=200)
+    return 4
+
+
+def persistir_recepcion() -> int:
+    solicitud_id = insertar_solicitud(XML_TEXTO)
+    actualizar_solicitud(solicitud_id, **RESULTADO_OK)
+    return 2
+
+
+def persistir_unico() -> int:
+    insertar_solicitud_completa(XML_TEXTO, **RESULTADO_OK)
+    return 1
+
+
+def posicion_wal() -> str:
+    with obtener_conexion_bd() as conn:
+        return conn.execute("SELECT pg_current_wal_lsn()::text").fetchone()[0]
+
+
+def bytes_wal(desde: str) -> int:
+    with obtener_conexion_bd() as conn:
+        return int(
+            conn.execute(
+                "SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s::pg_lsn)", (desde,)
+            ).fetchone()[0]
+        )
+
+
+def medir(nombre: str, funcion, iteraciones: int) -> None:
+    funcion()  # calentamiento (abre conexiones)
+    lsn = posicion_wal()
+    inicio = time.perf_counter()
+    sentencias = 0
+    for _ in range(iteraciones):
+        sentencias += funcion()
+    duracion = time.perf_counter() - inicio
+    wal = bytes_wal(lsn)
+    print(
+        f"{nombre:<10} {duracion / iteraciones * 1000:8.3f} ms/solicitud  "
+        f"{sentencias / iteraciones:.0f} sentencias/solicitud  "
+        f"{wal / iteraciones:8.0f} bytes WAL/solicitud"
+    )
+
+
+def main() -> None:
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pool_bd.open(wait=True)
+    try:
+        with obtener_conexion_bd() as conn:
+            aplicar_migraciones(conn)
+        print(f"{iteraciones} solicitudes por modo")
+        medir("pasos", persistir_pasos, iteraciones)
+        medir("recepcion", persistir_recepcion, iteraciones)
+        medir("unico", persistir_unico, iteraciones)
+    finally:
+        pool_bd.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark del prompt IA: XSD y XML completos frente a fragmentos enfocados.
+
+    python -m bench.bench_prompt [elementos_extra]
+
+Mide, para cada XML de ejemplo inválido, los tokens estimados del prompt en
+modo "full" y "focused" (AI_PROMPT_MODE). Se repite con un XSD sintético
+ampliado con `elementos_extra` definiciones globales, para ver cómo escala
+cada modo con esquemas del tamaño de los de la CNMC.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app import main
+from app.main import DocumentoXML, RegistroEsquemas, construir_prompt, estimar_tokens, validar_etapas
+
+EJEMPLOS = [
+    "datos/c1_xsd_invalido.xml",
+    "datos/c1_invalido_cups.xml",
+    "datos/c1_fecha_invalida.xml",
+]
+
+
+def xsd_ampliado(elementos_extra: int) -> bytes:
+    # Añade tipos y elementos globales que no intervienen en la validación
+    texto = Path(main.RUTA_XSD).read_text(encoding="utf-8-sig")
+    extra = "".join(
+        f'\n    <xsd:complexType name="TipoExtra{i}"><xsd:sequence>'
+        f'<xsd:element name="CampoA{i}" type="xsd:string"/>'
+        f'<xsd:element name="CampoB{i}" type="xsd:date" minOccurs="0"/>'
+        f"</xsd:sequence></xsd:complexType>"
+        f'\n    <xsd:element name="Extra{i}" type="TipoExtra{i}"/>'
+        for i in range(elementos_extra)
+    )
+    cierre = texto.rindex("</xsd:schema>")
+    return (texto[:cierre] + extra + "\n" + texto[cierre:]).encode("utf-8")
+
+
+def medir(titulo: str) -> None:
+    print(f"\n{titulo} ({len(main.registro_esquemas.defecto().contenido)} bytes de XSD)")
+    print(f"{'ejemplo':<28} {'full':>8} {'focused':>8} {'ahorro':>7} {'ms focused':>11}")
+    for ruta in EJEMPLOS:
+        documento = DocumentoXML(Path(ruta).read_bytes())
+        etapas = validar_etapas(documento)
+        mensaje_error = etapas.error_xsd or etapas.error_contenido
+        tokens = {}
+        for modo in ("full", "focused"):
+            main.MODO_PROMPT_IA = modo
+            inicio = time.perf_counter()
+            tokens[modo] = estimar_tokens(construir_prompt(documento, mensaje_error, etapas.errores_xsd))
+            duracion = time.perf_counter() - inicio
+        ahorro = 1 - tokens["focused"] / tokens["full"]
+        print(
+            f"{Path(ruta).name:<28} {tokens['full']:>8} {tokens['focused']:>8} "
+            f"{ahorro:>6.0%} {duracion * 1000:>11.2f}"
+        )
+
+
+def main_bench() -> None:
+    elementos_extra = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    modo_original = main.MODO_PROMPT_IA
+    registro_original = main.registro_esquemas
+    try:
+        main.registro_esquemas.cargar()
+        medir("XSD del repositorio")
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = Path(directorio) / "c1_ampliado.xsd"
+            ruta.write_bytes(xsd_ampliado(elementos_extra))
+            main.registro_esquemas = RegistroEsquemas(directorio, str(ruta), 0)
+            main.registro_esquemas.cargar()
+            medir(f"XSD sintético con {elementos_extra} elementos extra")
+    finally:
+        main.MODO_PROMPT_IA = modo_original
+        main.registro_esquemas = registro_original
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,70 @@
+"""Servidor LLM simulado (compatible con la API de chat de Groq/OpenAI).
+
+Permite probar y medir el análisis IA sin red ni API key real. Responde a
+POST /openai/v1/chat/completions tras una latencia configurable y puede
+devolver errores 503 con cierta probabilidad para ejercitar los reintentos.
+
+Uso (desde la raíz del repo):
+    STUB_LATENCY_MS=300 STUB_ERROR_RATE=0.1 uvicorn bench.stub_llm:app --port 9000
+
+y arrancar la API con:
+    GROQ_API_KEY=stub GROQ_BASE_URL=http://127.0.0.1:9000
+"""
+import asyncio
+import os
+import random
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+LATENCIA_MS = float(os.getenv("STUB_LATENCY_MS", "200"))
+TASA_ERROR = float(os.getenv("STUB_ERROR_RATE", "0"))
+
+app = FastAPI(title="Stub LLM")
+estadisticas = {"peticiones": 0, "errores": 0, "tokens_prompt": 0}
+
+
+@app.post("/openai/v1/chat/completions")
+async def completar_chat(request: Request):
+    cuerpo = await request.json()
+    estadisticas["peticiones"] += 1
+    prompt = "".join(mensaje.get("content", "") for mensaje in cuerpo.get("messages", []))
+    tokens_prompt = max(1, len(prompt) // 4)
+    estadisticas["tokens_prompt"] += tokens_prompt
+
+    await asyncio.sleep(LATENCIA_MS / 1000)
+
+    if random.random() < TASA_ERROR:
+        estadisticas["errores"] += 1
+        return JSONResponse(
+            status_code=503,
+            content={"error": {"message": "stub: servicio no disponible", "type": "server_error"}},
+        )
+
+    return {
+        "id": f"stub-{estadisticas['peticiones']}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": cuerpo.get("model", "stub"),
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": "* Respuesta simulada: revisa el elemento indicado en el error.",
+                },
+            }
+        ],
+        "usage": {
+            "prompt_tokens": tokens_prompt,
+            "completion_tokens": 12,
+            "total_tokens": tokens_prompt + 12,
+        },
+    }
+
+
+@app.get("/stats")
+async def consultar_estadisticas():
+    return estadisticas
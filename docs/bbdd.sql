@@ -1,9 +1,52 @@
 CREATE TABLE IF NOT EXISTS solicitudes_c1 (
   id BIGSERIAL PRIMARY KEY,
   recibido_en TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-  xml_recibido TEXT NOT NULL,
+  xml_recibido TEXT,
   xsd_valido BOOLEAN,
   contenido_valido BOOLEAN,
   analisis_ia TEXT,
-  estado_respuesta INTEGER
-);
\ No newline at end of file
+  estado_respuesta INTEGER,
+  hash_xml BYTEA
+);
+
+CREATE INDEX IF NOT EXISTS solicitudes_c1_hash_xml_idx
+  ON solicitudes_c1 (hash_xml, recibido_en DESC)
+  WHERE hash_xml IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS migraciones_esquema (
+  version INTEGER PRIMARY KEY,
+  descripcion TEXT NOT NULL,
+  aplicada_en TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS analisis_ia_cache (
+  huella TEXT PRIMARY KEY,
+  analisis TEXT NOT NULL,
+  creado_en TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  ultimo_uso TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  expira_en TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS analisis_ia_cache_ultimo_uso_idx
+  ON analisis_ia_cache (ultimo_uso);
+
+CREATE TABLE IF NOT EXISTS claves_idempotencia (
+  clave TEXT PRIMARY KEY,
+  hash_xml BYTEA NOT NULL,
+  estado_respuesta INTEGER,
+  respuesta JSON,
+  creado_en TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  expira_en TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS claves_idempotencia_expira_en_idx
+  ON claves_idempotencia (expira_en);
+
+CREATE TABLE IF NOT EXISTS xml_comprimidos (
+  hash_xml BYTEA PRIMARY KEY,
+  xml_gzip BYTEA NOT NULL,
+  bytes_originales BIGINT NOT NULL,
+  creado_en TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE xml_comprimidos ALTER COLUMN xml_gzip SET STORAGE EXTERNAL;
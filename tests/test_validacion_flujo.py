@@ -0,0 +1,56 @@
+"""Un XML truncado o sin cerrar se rechaza igual en modo árbol y en streaming.
+
+    python -m unittest discover tests
+"""
+import io
+import unittest
+from pathlib import Path
+
+from app.main import DocumentoXML, crear_contexto_validacion, validar_etapas, validar_flujo
+
+XML_CORRECTO = Path(__file__).resolve().parent.parent.joinpath("datos", "c1_correcto.xml").read_bytes()
+
+
+def sin_cierre(etiqueta: bytes) -> bytes:
+    # Quita la última etiqueta de cierre indicada
+    inicio = XML_CORRECTO.rindex(etiqueta)
+    return XML_CORRECTO[:inicio] + XML_CORRECTO[inicio + len(etiqueta):]
+
+
+XML_MAL_FORMADOS = {
+    "truncado -1": XML_CORRECTO.rstrip()[:-1],
+    "truncado -5": XML_CORRECTO.rstrip()[:-5],
+    "truncado -13": XML_CORRECTO.rstrip()[:-13],
+    "truncado -30": XML_CORRECTO.rstrip()[:-30],
+    "sin </Agentes>": sin_cierre(b"</Agentes>"),
+    "sin cierre del raíz": sin_cierre(b"</CambioComercializador>"),
+    "dos raíces": XML_CORRECTO + b"<CambioComercializador/>",
+}
+
+
+class ValidacionFlujoTest(unittest.TestCase):
+    def etapas(self, bytes_xml: bytes):
+        contexto = crear_contexto_validacion()
+        return (
+            ("árbol", validar_etapas(DocumentoXML(bytes_xml), contexto)),
+            ("streaming", validar_flujo(io.BytesIO(bytes_xml), contexto)),
+        )
+
+    def test_xml_correcto_pasa_el_xsd(self):
+        for modo, etapas in self.etapas(XML_CORRECTO):
+            with self.subTest(modo=modo):
+                self.assertTrue(etapas.xsd_valido, etapas.error_xsd)
+
+    def test_xml_mal_formado_se_rechaza(self):
+        for caso, bytes_xml in XML_MAL_FORMADOS.items():
+            resultados = self.etapas(bytes_xml)
+            for modo, etapas in resultados:
+                with self.subTest(caso=caso, modo=modo):
+                    self.assertFalse(etapas.xsd_valido)
+                    self.assertEqual(etapas.errores_xsd[0]["tipo"], "XML_PARSE_ERROR")
+            with self.subTest(caso=caso, modo="mismo error"):
+                self.assertEqual(resultados[0][1].error_xsd, resultados[1][1].error_xsd)
+
+
+if __name__ == "__main__":
+    unittest.main()